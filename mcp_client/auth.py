@@ -1,3 +1,4 @@
+import functools
 import getpass
 import webbrowser
 from mcp.client.auth import OAuthClientProvider
@@ -5,6 +6,23 @@ from mcp.shared.auth import OAuthClientMetadata
 from storage import InMemoryTokenStorage
 from callback import CallbackServer
 
+_USER_NAME = getpass.getuser()
+
+
+@functools.lru_cache(maxsize=8)
+def _client_metadata(scope: str) -> OAuthClientMetadata:
+    """Build (and memoize) the client metadata for a given scope string."""
+    return OAuthClientMetadata.model_validate(
+        {
+            "client_name": f"{_USER_NAME}'s client",
+            "redirect_uris": ["http://localhost:3030/callback"],
+            "grant_types": ["authorization_code", "refresh_token"],
+            "response_types": ["code"],
+            "scope": scope,
+            "token_endpoint_auth_method": "client_secret_post",
+        }
+    )
+
 
 def create_oauth_provider(server_url: str, scopes:list[str]) -> OAuthClientProvider:
     """Factory for OAuthClientProvider with default redirect/callback handling."""
@@ -21,20 +39,9 @@ def create_oauth_provider(server_url: str, scopes:list[str]) -> OAuthClientProvi
         print(f"🌐 Opening browser for authorization: {authorization_url}")
         webbrowser.open(authorization_url)
 
-    client_metadata = OAuthClientMetadata.model_validate(
-        {
-            "client_name": f"{getpass.getuser()}'s client",
-            "redirect_uris": ["http://localhost:3030/callback"],
-            "grant_types": ["authorization_code", "refresh_token"],
-            "response_types": ["code"],
-            "scope": " ".join(scopes),
-            "token_endpoint_auth_method": "client_secret_post",
-        }
-    )
-
     return OAuthClientProvider(
         server_url=server_url.replace("/mcp", ""),
-        client_metadata=client_metadata,
+        client_metadata=_client_metadata(" ".join(scopes)),
         redirect_handler=redirect_handler,
         storage=InMemoryTokenStorage(),
         callback_handler=callback_handler,
@@ -1,14 +1,31 @@
+import socket
 import threading
-import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import urlparse, parse_qs
 
 
+def _render_page(message: str) -> bytes:
+    return (
+        f"""
+            <html><body>
+                <h1>{message}</h1>
+                <p>You can close this window and return to the terminal.</p>
+                <script>setTimeout(() => window.close(), 2000);</script>
+            </body></html>
+            """
+    ).encode()
+
+
+# Success body never varies; build it once instead of per callback.
+_SUCCESS_PAGE = _render_page("Authorization Successful")
+
+
 class CallbackHandler(BaseHTTPRequestHandler):
     """Simple HTTP handler to capture OAuth callback."""
 
-    def __init__(self, request, client_address, server, callback_data):
+    def __init__(self, request, client_address, server, callback_data, done_event):
         self.callback_data = callback_data
+        self.done_event = done_event
         super().__init__(request, client_address, server)
 
     def do_GET(self):
@@ -18,28 +35,33 @@ class CallbackHandler(BaseHTTPRequestHandler):
         if "code" in query_params:
             self.callback_data["authorization_code"] = query_params["code"][0]
             self.callback_data["state"] = query_params.get("state", [None])[0]
-            self._send_page("Authorization Successful", success=True)
+            self._send_page(_SUCCESS_PAGE, success=True)
+            self.done_event.set()
+            self._stop_server()
         elif "error" in query_params:
             self.callback_data["error"] = query_params["error"][0]
-            self._send_page(f"Authorization Failed: {self.callback_data['error']}", success=False)
+            self._send_page(
+                _render_page(f"Authorization Failed: {self.callback_data['error']}"),
+                success=False,
+            )
+            self.done_event.set()
+            self._stop_server()
         else:
             self.send_response(404)
             self.end_headers()
 
-    def _send_page(self, message: str, success: bool):
+    def _stop_server(self):
+        # shutdown() must not run inside the handler thread (it would wait
+        # on serve_forever, which is waiting on us) — hand it off.
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    def _send_page(self, body: bytes, success: bool):
         status = 200 if success else 400
         self.send_response(status)
         self.send_header("Content-type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(
-            f"""
-            <html><body>
-                <h1>{message}</h1>
-                <p>You can close this window and return to the terminal.</p>
-                <script>setTimeout(() => window.close(), 2000);</script>
-            </body></html>
-            """.encode()
-        )
+        self.wfile.write(body)
 
     def log_message(self, format, *args):
         pass  # Suppress default logging
@@ -53,18 +75,26 @@ class CallbackServer:
         self.server = None
         self.thread = None
         self.callback_data = {"authorization_code": None, "state": None, "error": None}
+        self._done = threading.Event()
 
     def _handler(self):
         callback_data = self.callback_data
+        done_event = self._done
 
         class DataHandler(CallbackHandler):
             def __init__(self, req, addr, srv):
-                super().__init__(req, addr, srv, callback_data)
+                super().__init__(req, addr, srv, callback_data, done_event)
         return DataHandler
 
     def start(self):
-        self.server = HTTPServer(("localhost", self.port), self._handler())
-        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server = ThreadingHTTPServer(("localhost", self.port), self._handler())
+        # No Nagle delay on the single tiny response
+        self.server.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # serve_forever polls its shutdown flag; the default 0.5 s interval
+        # adds up to half a second to teardown after the callback.
+        self.thread = threading.Thread(
+            target=lambda: self.server.serve_forever(poll_interval=0.05), daemon=True
+        )
         self.thread.start()
         print(f"🖥️ Callback server running at http://localhost:{self.port}")
 
@@ -76,14 +106,11 @@ class CallbackServer:
             self.thread.join(timeout=1)
 
     def wait_for_callback(self, timeout=300):
-        start = time.time()
-        while time.time() - start < timeout:
-            if self.callback_data["authorization_code"]:
-                return self.callback_data["authorization_code"]
-            if self.callback_data["error"]:
-                raise Exception(f"OAuth error: {self.callback_data['error']}")
-            time.sleep(0.1)
-        raise TimeoutError("Timeout waiting for OAuth callback")
+        if not self._done.wait(timeout):
+            raise TimeoutError("Timeout waiting for OAuth callback")
+        if self.callback_data["error"]:
+            raise Exception(f"OAuth error: {self.callback_data['error']}")
+        return self.callback_data["authorization_code"]
 
     def get_state(self):
         return self.callback_data["state"]
\ No newline at end of file
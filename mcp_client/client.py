@@ -1,3 +1,6 @@
+import asyncio
+import json
+import time
 from datetime import timedelta
 from typing import Any
 from mcp.client.session import ClientSession
@@ -5,6 +8,10 @@ from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
 from auth import create_oauth_provider
 
+# Tool listings rarely change within a session; skip the MCP round trip
+# when the cached result is younger than this.
+TOOLS_CACHE_TTL = 30.0
+
 
 class SimpleAuthClient:
     """MCP client with OAuth authentication."""
@@ -13,6 +20,12 @@ class SimpleAuthClient:
         self.server_url = server_url
         self.transport_type = transport_type
         self.session: ClientSession | None = None
+        self._tools_cache = None
+        self._tools_cached_at = 0.0
+        self._handlers = {
+            "list": self._handle_list,
+            "call": self._handle_call,
+        }
 
     async def connect(self):
         print(f"🔗 Connecting to {self.server_url} with {self.transport_type}...")
@@ -45,7 +58,11 @@ class SimpleAuthClient:
         if not self.session:
             print("❌ Not connected")
             return
-        result = await self.session.list_tools()
+        now = time.monotonic()
+        if self._tools_cache is None or now - self._tools_cached_at > TOOLS_CACHE_TTL:
+            self._tools_cache = await self.session.list_tools()
+            self._tools_cached_at = now
+        result = self._tools_cache
         if result.tools:
             print("\n📋 Available tools:")
             for tool in result.tools:
@@ -62,23 +79,34 @@ class SimpleAuthClient:
         for c in getattr(result, "content", []):
             print(c.text if c.type == "text" else c)
 
+    async def _handle_list(self, rest: str):
+        await self.list_tools()
+
+    async def _handle_call(self, rest: str):
+        tool, _, raw_args = rest.partition(" ")
+        if not tool:
+            print("❌ Usage: call <tool> [json]")
+            return
+        args = {}
+        if raw_args:
+            try:
+                args = json.loads(raw_args)
+            except Exception:
+                print("❌ Invalid JSON args")
+        await self.call_tool(tool, args)
+
     async def interactive_loop(self):
         print("\n🎯 Interactive Client (commands: list, call <tool> [json], quit)")
+        loop = asyncio.get_running_loop()
         while True:
-            cmd = input("mcp> ").strip()
-            if cmd == "quit":
+            # Read stdin off-loop so background tasks (token refresh, HTTP
+            # keep-alives) keep running while the user types.
+            cmd = (await loop.run_in_executor(None, input, "mcp> ")).strip()
+            verb, _, rest = cmd.partition(" ")
+            if verb == "quit":
                 break
-            if cmd == "list":
-                await self.list_tools()
-            elif cmd.startswith("call "):
-                import json
-                _, tool, *rest = cmd.split(maxsplit=2)
-                args = {}
-                if rest:
-                    try:
-                        args = json.loads(rest[0])
-                    except Exception:
-                        print("❌ Invalid JSON args")
-                await self.call_tool(tool, args)
+            handler = self._handlers.get(verb)
+            if handler:
+                await handler(rest.strip())
             else:
                 print("❌ Unknown command")
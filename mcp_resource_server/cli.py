@@ -1,4 +1,5 @@
 import logging
+import sys
 import click
 from pydantic import AnyHttpUrl
 from typing import Literal
@@ -29,12 +30,19 @@ def main(port: int, gravitee_am: str, transport: Literal["sse", "streamable-http
             gravitee_am_url=am_url,
             gravitee_am_introspection_endpoint=f"{gravitee_am}/oauth/introspect",
             gravitee_am_userinfo_endpoint=f"{gravitee_am}/oidc/userinfo",
+            gravitee_am_jwks_endpoint=f"{gravitee_am}/oidc/.well-known/jwks.json",
             oauth_strict=oauth_strict,
         )
     except ValueError as e:
         logging.error(f"Config error: {e}")
         return 1
 
+    # Every hot path in this server is asyncio-bound; uvloop roughly doubles
+    # event-loop throughput at no code cost (not available on Windows).
+    if sys.platform != "win32":
+        import uvloop
+        uvloop.install()
+
     mcp_server = create_resource_server(settings)
 
     logging.info(f"🚀 MCP Resource Server running on {settings.server_url}")
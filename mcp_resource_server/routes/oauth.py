@@ -1,16 +1,21 @@
 import json
+import os
 from pathlib import Path
 
 import httpx
-from urllib.parse import urlencode
-from starlette.responses import JSONResponse, RedirectResponse
+import orjson
+from urllib.parse import parse_qsl, urlencode
+from starlette.responses import JSONResponse, RedirectResponse, Response
 
 CREDENTIALS_FILE = Path.home() / ".mcp_server" / "client_credentials.json"
 
 def save_credentials(data: dict):
     CREDENTIALS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with CREDENTIALS_FILE.open("w") as f:
+    # Write to a temp file then rename so a crash never leaves a partial file
+    tmp_path = CREDENTIALS_FILE.with_suffix(".json.tmp")
+    with tmp_path.open("w") as f:
         json.dump(data, f, indent=2)
+    os.replace(tmp_path, CREDENTIALS_FILE)
 
 def load_credentials() -> dict:
     if CREDENTIALS_FILE.exists():
@@ -18,35 +23,52 @@ def load_credentials() -> dict:
             return json.load(f)
     return {}
 
-def register(mcp, settings, token_verifier):
+def create_am_client(settings) -> httpx.AsyncClient:
+    """One pooled client for all proxied calls to Gravitee AM.
+
+    Keep-alive connections avoid a TCP+TLS handshake per inbound request,
+    and HTTP/2 multiplexes concurrent token exchanges over one socket.
+    """
+    return httpx.AsyncClient(
+        base_url=str(settings.gravitee_am_url),
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+    )
+
+
+def register(mcp, settings, token_verifier, am_client):
+    # Credentials never change after the first registration: read the file
+    # once here and serve subsequent /register calls from memory.
+    cached_credentials = load_credentials()
+
     @mcp.custom_route("/register", methods=["POST"])
     async def register_client(request):
         """Dynamic Client Registration (RFC 7591) with auto-persistence."""
+        nonlocal cached_credentials
         try:
-            data = load_credentials()
-            if not data:
+            if not cached_credentials:
                 client_metadata = await request.json()
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        f"{settings.gravitee_am_url}/oidc/register",
-                        json=client_metadata,
-                        headers={"Content-Type": "application/json"},
-                        timeout=10,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    del data['registration_access_token']
-                    del data['registration_client_uri']
-                    # Save full registration data to disk
-                    save_credentials(data)
+                response = await am_client.post(
+                    "/oidc/register",
+                    json=client_metadata,
+                    headers={"Content-Type": "application/json"},
+                )
+                response.raise_for_status()
+                data = response.json()
+                del data['registration_access_token']
+                del data['registration_client_uri']
+                # Save full registration data to disk
+                save_credentials(data)
+                cached_credentials = data
 
             # Update token verifier in memory
-            token_verifier.client_id = data["client_id"]
-            token_verifier.client_secret = data["client_secret"]
+            token_verifier.client_id = cached_credentials["client_id"]
+            token_verifier.client_secret = cached_credentials["client_secret"]
 
-            del data['client_secret']
-            return JSONResponse(content=data)
+            public_data = {k: v for k, v in cached_credentials.items() if k != "client_secret"}
+            return Response(content=orjson.dumps(public_data), media_type="application/json")
         except Exception as e:
             return JSONResponse(content={"error": str(e)}, status_code=400)
 
@@ -64,8 +86,8 @@ def register(mcp, settings, token_verifier):
             body_bytes = await request.body()
             body_str = body_bytes.decode()
 
-            # Parse body into key-value pairs
-            form_dict = dict(item.split("=", 1) for item in body_str.split("&") if "=" in item)
+            # Parse body into key-value pairs (handles percent-encoding)
+            form_dict = dict(parse_qsl(body_str, keep_blank_values=True))
 
             # Conditionally add client_secret
             if form_dict.get("client_id") == token_verifier.client_id:
@@ -75,17 +97,16 @@ def register(mcp, settings, token_verifier):
                 form_dict.pop("client_secret", None)
 
             # Re-encode body
-            body_with_creds = "&".join(f"{k}={v}" for k, v in form_dict.items())
-
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{settings.gravitee_am_url}/oauth/token",
-                    content=body_with_creds,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=10,
-                )
-                resp.raise_for_status()
-                return JSONResponse(content=resp.json())
+            body_with_creds = urlencode(form_dict)
+
+            resp = await am_client.post(
+                "/oauth/token",
+                content=body_with_creds,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            resp.raise_for_status()
+            # Forward the AS response bytes as-is; no parse/re-encode round trip
+            return Response(content=resp.content, media_type="application/json")
 
         except httpx.HTTPStatusError as e:
             return JSONResponse(
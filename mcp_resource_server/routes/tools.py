@@ -1,43 +1,184 @@
+import asyncio
 import datetime
 from typing import Any
 
+import httpx
+import orjson
+from cachetools import TTLCache
 from mcp.server.fastmcp import Context
 from mcp.server.fastmcp.exceptions import ToolError
 
-def register(mcp):
+# Email domains allowed to use the admin-only tools
+_ALLOWED_DOMAINS = frozenset({"graviteesource.com"})
+
+# Shared client for the third-party geo/weather APIs; keep-alive connections
+# amortize the TLS handshake across tool calls.
+_http = httpx.AsyncClient(
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=10),
+)
+
+
+async def aclose():
+    """Release the shared HTTP client; called from the server lifespan."""
+    await _http.aclose()
+
+_PHOTON_URL = "https://photon.komoot.io/api"
+_WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
+_DAILY_PARAMS = (
+    "weather_code,temperature_2m_max,temperature_2m_min,"
+    "precipitation_sum,wind_speed_10m_max"
+)
+
+# Third-party results are effectively static for a while: geocoding barely
+# changes, daily forecasts refresh on the order of minutes.
+_geo_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_forecast_cache: TTLCache = TTLCache(maxsize=1024, ttl=900)
+
+# Single-flight map: concurrent searches for the same query share one
+# upstream call instead of issuing N identical ones.
+_geo_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _fetch_locations(query: str, cache_key: str) -> list[dict[str, Any]]:
+    # httpx percent-encodes params itself — do not quote() the query here,
+    # it would double-encode
+    try:
+        response = await _http.get(_PHOTON_URL, params={"q": query, "limit": 5})
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise ToolError(f"Location search failed: {e}")
+    results = []
+    for feature in orjson.loads(response.content).get("features", []):
+        props = feature.get("properties", {})
+        lon, lat = feature["geometry"]["coordinates"]
+        results.append(
+            {
+                "name": props.get("name"),
+                "country": props.get("country"),
+                "lat": lat,
+                "lon": lon,
+            }
+        )
+    _geo_cache[cache_key] = results
+    return results
+
+
+def get_user_claims(ctx: Context):
+    # The claims never change within a request; stash them on the request
+    # object so repeated reads skip the attribute walk.
+    request = ctx.request_context.request
+    claims = getattr(request, "_mcp_claims", None)
+    if claims is None:
+        claims = request.user.access_token.claims
+        request._mcp_claims = claims
+    return claims
+
+
+async def _fetch_forecasts(pairs: list[tuple[float, float]]) -> list[dict[str, Any]]:
+    """Fetch daily forecasts for the given coordinates.
+
+    Cache misses are collapsed into a single upstream call — open-meteo
+    accepts comma-separated latitude/longitude lists.
+    """
+    forecasts = {pair: _forecast_cache.get(pair) for pair in pairs}
+    misses = [pair for pair, forecast in forecasts.items() if forecast is None]
+    if misses:
+        try:
+            response = await _http.get(
+                _WEATHER_URL,
+                params={
+                    "latitude": ",".join(str(lat) for lat, _ in misses),
+                    "longitude": ",".join(str(lon) for _, lon in misses),
+                    "daily": _DAILY_PARAMS,
+                    "timezone": "UTC",
+                },
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise ToolError(f"Weather forecast failed: {e}")
+        data = orjson.loads(response.content)
+        # open-meteo returns a bare object for one location, a list for several
+        for pair, forecast in zip(misses, data if isinstance(data, list) else [data]):
+            forecasts[pair] = forecast
+            _forecast_cache[pair] = forecast
+    return [forecasts[pair] for pair in pairs]
 
-    def get_user_claims(ctx:Context):
-        return ctx.request_context.request.user.access_token.claims
+
+def _location_pair(lat: float, lon: float) -> tuple[float, float]:
+    # Sub-0.01 degree precision is meaningless for a daily forecast
+    return round(lat, 2), round(lon, 2)
+
+
+def _time_payload() -> dict[str, Any]:
+    # The response claims UTC, so use an aware UTC now(); deriving the
+    # formatted string from the isoformat output skips a strftime pass.
+    now = datetime.datetime.now(datetime.UTC)
+    iso = now.isoformat()
+    return {
+        "current_time": iso,
+        "timezone": "UTC",
+        "timestamp": now.timestamp(),
+        "formatted": iso[:19].replace("T", " "),
+    }
+
+
+def require_allowed_domain(ctx: Context):
+    """Raise unless the caller's email belongs to an allowed domain."""
+    email = get_user_claims(ctx)['email']
+    at = email.rfind("@")
+    # Exact domain match — a suffix check would let lookalike domains
+    # (e.g. evilgraviteesource.com) through
+    if at < 0 or email[at + 1:] not in _ALLOWED_DOMAINS:
+        raise ToolError("403", "Forbidden", "Cannot get time sorry!")
+
+
+def register(mcp):
 
     @mcp.tool()
     async def get_time(ctx:Context) -> dict[str, Any]:
         """Return current server time (protected by OAuth)."""
-        now = datetime.datetime.now()
-        return {
-            "current_time": now.isoformat(),
-            "timezone": "UTC",
-            "timestamp": now.timestamp(),
-            "formatted": now.strftime("%Y-%m-%d %H:%M:%S"),
-        }
+        return _time_payload()
 
     @mcp.tool()
     async def get_time_but_you_are_an_admin(ctx:Context) -> dict[str, Any]:
         """
         Return current server time (protected by OAuth).
         """
-        claims = get_user_claims(ctx)
-        if "graviteesource.com" in claims['email']:
-            now = datetime.datetime.now()
-            return {
-                "current_time": now.isoformat(),
-                "timezone": "UTC",
-                "timestamp": now.timestamp(),
-                "formatted": now.strftime("%Y-%m-%d %H:%M:%S"),
-            }
-        else:
-            raise ToolError("403", "Forbidden", "Cannot get time sorry!")
+        require_allowed_domain(ctx)
+        return _time_payload()
 
     @mcp.tool()
     async def get_user_profile(ctx: Context) -> dict[str, Any]:
         """Return current server time (protected by OAuth)."""
-        return get_user_claims(ctx)
\ No newline at end of file
+        return get_user_claims(ctx)
+
+    @mcp.tool()
+    async def search_locations(query: str, ctx: Context) -> list[dict[str, Any]]:
+        """Search locations by name and return candidate coordinates (protected by OAuth)."""
+        cache_key = query.strip().lower()
+        cached = _geo_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        task = _geo_inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(_fetch_locations(query, cache_key))
+            _geo_inflight[cache_key] = task
+            try:
+                return await task
+            finally:
+                _geo_inflight.pop(cache_key, None)
+        return await task
+
+    @mcp.tool()
+    async def get_weather_forecast(lat: float, lon: float, ctx: Context) -> dict[str, Any]:
+        """Return the daily forecast for the given coordinates (protected by OAuth)."""
+        forecasts = await _fetch_forecasts([_location_pair(lat, lon)])
+        return forecasts[0]
+
+    @mcp.tool()
+    async def get_weather_forecast_batch(
+        locations: list[tuple[float, float]], ctx: Context
+    ) -> list[dict[str, Any]]:
+        """Return daily forecasts for several (lat, lon) pairs with one upstream call (protected by OAuth)."""
+        return await _fetch_forecasts([_location_pair(lat, lon) for lat, lon in locations])
\ No newline at end of file
@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 
 from mcp.server.auth.settings import AuthSettings
 from mcp.server.fastmcp.server import FastMCP
@@ -9,6 +10,8 @@ from routes import tools, oauth
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["create_resource_server"]
+
 
 def create_resource_server(settings: ResourceServerSettings) -> FastMCP:
     """Create MCP Resource Server with Gravitee AM token introspection."""
@@ -18,16 +21,30 @@ def create_resource_server(settings: ResourceServerSettings) -> FastMCP:
         userinfo_endpoint=settings.gravitee_am_userinfo_endpoint,
         server_url=str(settings.server_url),
         validate_resource=settings.oauth_strict,
+        jwks_endpoint=settings.gravitee_am_jwks_endpoint,
     )
 
     token_verifier.load_client_credentials()
 
+    am_client = oauth.create_am_client(settings)
+
+    @asynccontextmanager
+    async def lifespan(_server: FastMCP):
+        try:
+            yield {}
+        finally:
+            # Release the pooled connections on shutdown
+            await am_client.aclose()
+            await token_verifier.aclose()
+            await tools.aclose()
+
     mcp = FastMCP(
         name="MCP Resource Server",
         instructions="Validates tokens via Gravitee AM introspection",
         host=settings.host,
         port=settings.port,
         debug=True,
+        lifespan=lifespan,
         token_verifier=token_verifier,
         auth=AuthSettings(
             issuer_url=settings.gravitee_am_url,
@@ -38,6 +55,6 @@ def create_resource_server(settings: ResourceServerSettings) -> FastMCP:
 
     # Register routes in separate modules
     tools.register(mcp)
-    oauth.register(mcp, settings, token_verifier)
+    oauth.register(mcp, settings, token_verifier, am_client)
 
     return mcp
@@ -1,17 +1,67 @@
 """Example token verifier implementation using OAuth 2.0 Token Introspection (RFC 7662)."""
+import asyncio
+import functools
+import hashlib
 import json
 import logging
+import sys
+import time
 from pathlib import Path
 from typing import Any
 
+import httpx
+import jwt
+import orjson
+from cachetools import TTLCache
 from mcp.server.auth.provider import AccessToken, TokenVerifier
+from pydantic import ConfigDict
 from mcp.shared.auth_utils import check_resource_allowed, resource_url_from_server_url
 
 logger = logging.getLogger(__name__)
 DEFAULT_CREDENTIALS_PATH = Path.home() / ".mcp_server" / "client_credentials.json"
 
+# HTTP client configuration shared by every verifier instance
+_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5)
+
+
+def _parse_scopes(scope: str | None) -> list[str]:
+    """Split a space-delimited scope string, tolerating a missing claim.
+
+    The scope vocabulary is tiny and shared by every token, so intern the
+    strings rather than keeping a fresh copy per cached entry.
+    """
+    return [sys.intern(s) for s in (scope or "").split()]
+
+
+@functools.lru_cache(maxsize=256)
+def _resource_allowed(requested_resource: str, configured_resource: str) -> bool:
+    """Memoized check_resource_allowed — the audience vocabulary is tiny, so
+    the URL normalization work is paid once per (requested, configured) pair."""
+    return check_resource_allowed(
+        requested_resource=requested_resource, configured_resource=configured_resource
+    )
+
+
+
+# How long a successful introspection result may be served from memory.
+# Individual entries are still rejected once the token's own exp passes.
+TOKEN_CACHE_TTL = 300
+
+# How long a rejected token stays rejected without re-asking the AS. Kept
+# short so a token revoked and reissued is not pinned as invalid.
+NEGATIVE_CACHE_TTL = 10
+
+# Signature algorithms accepted on the local-JWT fast path. Gravitee AM signs
+# access tokens with RS256 by default.
+ALLOWED_JWT_ALGORITHMS = ["RS256"]
+
 class AccessTokenWithClaims(AccessToken):
-    claims: dict
+    # Store the claims dict as-is: Any skips Pydantic's per-entry validation
+    # pass (a deep traversal of the whole profile on every auth), and
+    # validate_assignment stays off so later writes don't re-validate.
+    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=False)
+    claims: Any
 
 class IntrospectionTokenVerifier(TokenVerifier):
     """Example token verifier that uses OAuth 2.0 Token Introspection (RFC 7662).
@@ -30,6 +80,7 @@ class IntrospectionTokenVerifier(TokenVerifier):
         userinfo_endpoint: str,
         server_url: str,
         validate_resource: bool = False,
+        jwks_endpoint: str | None = None,
     ):
         self.introspection_endpoint = introspection_endpoint
         self.userinfo_endpoint = userinfo_endpoint
@@ -39,6 +90,29 @@ class IntrospectionTokenVerifier(TokenVerifier):
         # Default client creds (will be updated by /register)
         self.client_id: str | None = None
         self.client_secret: str | None = None
+        self._token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL)
+        # Single-flight map: concurrent verifications of the same token share
+        # one upstream introspection instead of issuing N identical calls.
+        self._inflight: dict[bytes, asyncio.Task] = {}
+        # Rejected tokens; absorbs replays of invalid tokens without a round trip
+        self._neg_cache: TTLCache = TTLCache(maxsize=50_000, ttl=NEGATIVE_CACHE_TTL)
+        # One pooled client for all introspection/userinfo traffic; keep-alive
+        # connections avoid a TCP+TLS handshake per verification.
+        self._client = httpx.AsyncClient(
+            timeout=_TIMEOUT,
+            limits=_LIMITS,
+            verify=True,  # Enforce SSL verification
+        )
+        # Optional JWT fast path: verify signature/exp locally against the
+        # AS JWKS and skip introspection entirely for well-formed JWTs.
+        # PyJWKClient caches fetched keys internally.
+        self._jwks_client = (
+            jwt.PyJWKClient(jwks_endpoint, cache_keys=True) if jwks_endpoint else None
+        )
+
+    async def aclose(self):
+        """Release the pooled HTTP client."""
+        await self._client.aclose()
 
     def set_client_credentials(
         self, client_id: str, client_secret: str
@@ -59,11 +133,89 @@ class IntrospectionTokenVerifier(TokenVerifier):
                 creds.get("client_secret")
             )
 
+    def _primary_audience(self, aud: list[str] | str | None) -> str | None:
+        """Collapse an aud claim to the single string AccessToken.resource holds.
+
+        RFC 7519 allows a list of audiences; prefer the one matching this
+        server, else the first. The handful of RS URLs that ever appear are
+        interned rather than kept as fresh copies per cached token.
+        """
+        if isinstance(aud, list):
+            aud = next((a for a in aud if self._is_valid_resource(a)), aud[0] if aud else None)
+        return sys.intern(aud) if isinstance(aud, str) else None
+
+    def _verify_jwt_locally(self, token: str) -> AccessTokenWithClaims | None:
+        """Validate a JWT access token against the AS JWKS.
+
+        Blocking: PyJWKClient fetches the JWKS with urlopen on a cache miss,
+        so callers on the event loop must run this in an executor.
+        """
+        if self._jwks_client is None:
+            return None
+        try:
+            # Never take the algorithm from the token header — the JWKS is
+            # public, so an attacker could otherwise pick e.g. HS256 against
+            # an RSA key.
+            signing_key = self._jwks_client.get_signing_key_from_jwt(token)
+            payload = jwt.decode(
+                token,
+                signing_key.key,
+                algorithms=ALLOWED_JWT_ALGORITHMS,
+                options={"verify_aud": False},
+            )
+
+            if self.validate_resource and not self._validate_resource(payload):
+                logger.warning(f"Token resource validation failed. Expected: {self.resource_url}")
+                return None
+
+            # Construction may also fail validation (e.g. client_id is still
+            # None before /register has run) — treat that like any other
+            # local failure and let introspection decide.
+            return AccessTokenWithClaims(
+                token=token,
+                client_id=payload.get("client_id", self.client_id),
+                scopes=_parse_scopes(payload.get("scope")),
+                expires_at=payload.get("exp"),
+                resource=self._primary_audience(payload.get("aud")),
+                claims=payload,
+            )
+        except Exception:
+            # Opaque token, unknown key or failed validation: introspect instead
+            return None
+
     async def verify_token(self, token: str) -> AccessTokenWithClaims | None:
-        """Verify token via introspection endpoint."""
-        import httpx
+        """Verify token via local JWT validation, falling back to introspection."""
+        # Serve hot tokens from memory; both AS round trips are skipped.
+        cache_key = hashlib.sha256(token.encode()).digest()
+        if cache_key in self._neg_cache:
+            return None
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            if cached.expires_at is None or cached.expires_at > time.time():
+                return cached
+            del self._token_cache[cache_key]
+
+        # Run in an executor: the JWKS fetch on a cold cache is blocking I/O
+        # and the RSA verify itself is CPU-bound.
+        local = await asyncio.get_running_loop().run_in_executor(
+            None, self._verify_jwt_locally, token
+        )
+        if local is not None:
+            self._token_cache[cache_key] = local
+            return local
 
-        """Verify token with currently stored client credentials."""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._introspect(token, cache_key))
+            self._inflight[cache_key] = task
+            try:
+                return await task
+            finally:
+                self._inflight.pop(cache_key, None)
+        return await task
+
+    async def _introspect(self, token: str, cache_key: bytes) -> AccessTokenWithClaims | None:
+        """Resolve a token via the remote introspection + userinfo endpoints."""
         if not self.client_id or not self.client_secret:
             raise ValueError("No client credentials set for introspection")
 
@@ -72,52 +224,60 @@ class IntrospectionTokenVerifier(TokenVerifier):
             logger.warning(f"Rejecting introspection endpoint with unsafe scheme: {self.introspection_endpoint}")
             return None
 
-        # Configure secure HTTP client
-        timeout = httpx.Timeout(10.0, connect=5.0)
-        limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
-
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=limits,
-            verify=True,  # Enforce SSL verification
-        ) as client:
-            try:
-                response = await client.post(
+        try:
+            # Both calls only need the token itself, so issue them together:
+            # one round trip of latency instead of two. The userinfo result is
+            # simply discarded when introspection rejects the token.
+            response, userInfo = await asyncio.gather(
+                self._client.post(
                     self.introspection_endpoint,
                     data={"token": token, "client_id": self.client_id, "client_secret": self.client_secret},
                     headers=[("Content-Type", "application/x-www-form-urlencoded")],
-                )
-
-                if response.status_code != 200:
-                    logger.debug(f"Token introspection returned status {response.status_code}")
-                    return None
+                ),
+                self._client.get(
+                    self.userinfo_endpoint,
+                    headers=[("Authorization", f"Bearer {token}")],
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(response, BaseException):
+                raise response
 
-                data = response.json()
-                if not data.get("active", False):
-                    return None
+            if response.status_code != 200:
+                logger.debug(f"Token introspection returned status {response.status_code}")
+                self._neg_cache[cache_key] = True
+                return None
 
-                # RFC 8707 resource validation (only when --oauth-strict is set)
-                if self.validate_resource and not self._validate_resource(data):
-                    logger.warning(f"Token resource validation failed. Expected: {self.resource_url}")
-                    return None
+            data = orjson.loads(response.content)
+            if not data.get("active", False):
+                self._neg_cache[cache_key] = True
+                return None
 
-                userInfo = await client.get(
-                    self.userinfo_endpoint,
-                    headers=[("Authorization", f"Bearer {token}")],
-                )
-
-                return AccessTokenWithClaims(
-                    token=token,
-                    client_id=data.get("client_id", self.client_id),
-                    scopes=data.get("scope").split(" "),
-                    expires_at=data.get("exp"),
-                    resource=data.get("aud"),
-                    claims=userInfo.json()
-                )
-            except Exception as e:
-                logger.warning(f"Token introspection failed: {e}")
+            # RFC 8707 resource validation (only when --oauth-strict is set)
+            if self.validate_resource and not self._validate_resource(data):
+                logger.warning(f"Token resource validation failed. Expected: {self.resource_url}")
+                self._neg_cache[cache_key] = True
                 return None
 
+            if isinstance(userInfo, BaseException):
+                raise userInfo
+
+            result = AccessTokenWithClaims(
+                token=token,
+                client_id=data.get("client_id", self.client_id),
+                scopes=_parse_scopes(data.get("scope")),
+                expires_at=data.get("exp"),
+                resource=self._primary_audience(data.get("aud")),
+                claims=orjson.loads(userInfo.content)
+            )
+            # Only cache active tokens; entries expire with the cache TTL
+            # or the token's own exp, whichever comes first.
+            self._token_cache[cache_key] = result
+            return result
+        except Exception as e:
+            logger.warning(f"Token introspection failed: {e}")
+            return None
+
     def _validate_resource(self, token_data: dict[str, Any]) -> bool:
         """Validate token was issued for this resource mcp_resource_server."""
         if not self.server_url or not self.resource_url:
@@ -141,5 +301,5 @@ class IntrospectionTokenVerifier(TokenVerifier):
         if not self.resource_url:
             return False
 
-        return check_resource_allowed(requested_resource=self.resource_url, configured_resource=resource)
+        return _resource_allowed(str(self.resource_url), resource)
 